@@ -27,6 +27,21 @@ from pywikibot.bot import SingleSiteBot, CurrentPageBot
 # Configuration
 NAME_LIST_PAGE = "MediaWiki:CharacterList"
 
+# Regex to find links: [[Target]] or [[Target|Label]]
+# Targets may not contain line breaks (MediaWiki does not link them either),
+# so an unclosed "[[" only scans to the end of its line for the target.
+# Labels may still span lines, as in MediaWiki.
+LINK_RE = re.compile(r"""
+    \[\[
+    ([^|\]\n]+)      # Group 1: Target
+    (\|([^\]]+))?    # Group 2: |Label (optional)
+                     # Group 3: Label (content of group 2 without pipe)
+    \]\]
+""", re.VERBOSE)
+
+# Protected areas skipped by textlib.replaceExcept
+EXCLUDE_TAGS = ('comment', 'math', 'nowiki', 'pre', 'source', 'syntaxhighlight')
+
 class CharacterLinkFixBot(SingleSiteBot, CurrentPageBot):
     """
     Bot to reverse character names in links.
@@ -38,7 +53,7 @@ class CharacterLinkFixBot(SingleSiteBot, CurrentPageBot):
         
         Args:
             generator: The page generator.
-            valid_names (set): A set of valid character names (already in correct order).
+            valid_names (frozenset): A set of valid character names (already in correct order).
         """
         self.available_options.update({
             'always': False,
@@ -53,116 +68,132 @@ class CharacterLinkFixBot(SingleSiteBot, CurrentPageBot):
         Example: "Aoi Megumi" -> "Megumi Aoi"
         """
         parts = name.split()
-        if len(parts) >= 2:
+        # Common two-word name: format directly instead of reversing and joining
+        if len(parts) == 2:
+            return f'{parts[1]} {parts[0]}'
+        if len(parts) > 2:
             return ' '.join(parts[::-1])
         return name
 
-    def replace_link(self, match):
-        """
-        Callback function to process each link match found by regex.
-        """
-        full_match = match.group(0)
-        raw_target = match.group(1).strip()
-        # group(2) is the pipe including |, group(3) is the text after pipe
-        display_text = match.group(3) 
-
-        # Handle anchors (e.g., [[Page#Section]])
-        if '#' in raw_target:
-            base_target, anchor_part = raw_target.split('#', 1)
-            anchor_part = f'#{anchor_part}'
-        else:
-            base_target = raw_target
-            anchor_part = ''
-
-        # Calculate potential new target
-        new_base_target = base_target
-        reversed_candidate = self.reverse_name(base_target)
-
-        # LOGIC CHECK: Only change if the reversed version is in the valid list
-        # and it is different from the current target.
-        if reversed_candidate in self.valid_names and reversed_candidate != base_target:
-            new_base_target = reversed_candidate
-        
-        final_target = new_base_target + anchor_part
-
-        # If no change in target, return original text
-        if final_target == raw_target:
-            # Cleanup: if [[Target|Target]], simplify to [[Target]]
-            if display_text and display_text.strip() == base_target:
-                return f'[[{final_target}]]'
-            return full_match
-
-        # Construct the new link
-        if display_text:
-            # If label matches the new target or old target, simplify link
-            if display_text.strip() == base_target or display_text.strip() == new_base_target:
-                return f'[[{final_target}]]'
-            return f'[[{final_target}|{display_text}]]'
-        else:
-            return f'[[{final_target}]]'
-
     def treat_page(self):
         """
         Process a single page.
         """
         page = self.current_page
+        title = page.title()
         
         # Skip Main Page
-        if page.title() == self.site.siteinfo['mainpage']:
-            pywikibot.info(f'Skipping Main Page: {page.title()}')
+        if title == self.site.siteinfo['mainpage']:
+            pywikibot.info(f'Skipping Main Page: {title}')
             return
 
         # Skip non-main namespace (redundant if generator is filtered, but safe)
         if page.namespace() != 0:
-            pywikibot.info(f'Skipping non-article page: {page.title()}')
+            pywikibot.info(f'Skipping non-article page: {title}')
             return
 
-        pywikibot.info(f'Processing page: {page.title()}')
+        pywikibot.info(f'Processing page: {title}')
         
         text = page.text
         original_text = text
 
-        # Regex to find links: [[Target]] or [[Target|Label]]
-        # Group 1: Target
-        # Group 2: |Label (optional)
-        # Group 3: Label (content of group 2 without pipe)
-        link_pattern = re.compile(r'\[\[([^\|\]]+)(\|([^\]]+))?\]\]')
+        # Cheap substring check before running the link regex over the page
+        if '[[' not in text:
+            pywikibot.info(f'No links found on {title}')
+            return
+
+        # Bind per-link lookups as locals so the callback below avoids
+        # attribute access on self for every link on the page.
+        # decision caches base_target -> new_base_target for repeated links.
+        decision = {}
+
+        def repl(match, vn=self.valid_names, rev=self.reverse_name, decision=decision):
+            """
+            Callback function to process each link match found by regex.
+            """
+            full_match = match.group(0)
+            raw_target = match.group(1).strip()
+            # group(2) is the pipe including |, group(3) is the text after pipe
+            display_text = match.group(3)
+
+            # Handle anchors (e.g., [[Page#Section]])
+            if '#' in raw_target:
+                base_target, anchor_part = raw_target.split('#', 1)
+                anchor_part = f'#{anchor_part}'
+            else:
+                base_target = raw_target
+                anchor_part = ''
+
+            # Calculate potential new target
+            new_base_target = decision.get(base_target)
+            if new_base_target is None:
+                new_base_target = base_target
+                reversed_candidate = rev(base_target)
+
+                # LOGIC CHECK: Only change if the reversed version is in the valid list
+                # and it is different from the current target.
+                if reversed_candidate in vn and reversed_candidate != base_target:
+                    new_base_target = reversed_candidate
+                decision[base_target] = new_base_target
+
+            final_target = new_base_target + anchor_part
+
+            # If no change in target, return original text
+            if final_target == raw_target:
+                # Cleanup: if [[Target|Target]], simplify to [[Target]]
+                if display_text and display_text.strip() == base_target:
+                    return f'[[{final_target}]]'
+                return full_match
+
+            # Construct the new link
+            if display_text:
+                # If label matches the new target or old target, simplify link
+                if display_text.strip() == base_target or display_text.strip() == new_base_target:
+                    return f'[[{final_target}]]'
+                return f'[[{final_target}|{display_text}]]'
+            else:
+                return f'[[{final_target}]]'
 
         # Use textlib.replaceExcept to safely replace text ignoring protected areas
         # (nowiki, comments, pre, source, math, etc.)
         new_text = textlib.replaceExcept(
             text,
-            link_pattern,
-            self.replace_link,
-            ['comment', 'math', 'nowiki', 'pre', 'source', 'syntaxhighlight'],
+            LINK_RE,
+            repl,
+            EXCLUDE_TAGS,
             site=self.site
         )
 
         # Save changes if any
         if new_text != original_text:
-            self.put_current(new_text, summary=self.opt.summary, show_diff=True)
+            # Skip the diff for unattended saves, but keep it in simulate mode
+            self.put_current(new_text, summary=self.opt.summary,
+                             show_diff=not self.opt.always or pywikibot.config.simulate)
         else:
-            pywikibot.info(f'No changes required for {page.title()}')
+            pywikibot.info(f'No changes required for {title}')
 
-def get_valid_names(site) -> set:
+def get_valid_names(site) -> frozenset:
     """
     Fetches the list of valid names from the wiki page.
     """
     page = pywikibot.Page(site, NAME_LIST_PAGE)
-    names = set()
 
     if not page.exists():
         pywikibot.warning(f"Name list page not found: {NAME_LIST_PAGE}")
-        return names
+        return frozenset()
 
     pywikibot.info(f"Loading valid names from {NAME_LIST_PAGE}...")
-    for line in page.text.splitlines():
-        line = line.strip()
-        if line.startswith("* "):
-            name = line[2:].strip()
-            if name:
-                names.add(name)
-    
+    # Collect "* Name" list items, skipping empty entries
+    names = frozenset(
+        name
+        for name in (
+            line[2:].strip()
+            for line in map(str.lstrip, page.text.splitlines())
+            if line.startswith("* ")
+        )
+        if name
+    )
+
     pywikibot.info(f"Loaded {len(names)} valid names.")
     return names
 
@@ -197,7 +228,10 @@ def main(*args):
     # NOTE: Unlike the old script, we do NOT default to ALL pages automatically for safety.
     # Users should explicitily pass -start:! or -ns:0 to run on all pages.
     if generator:
-        generator = pagegenerators.PreloadingGenerator(generator)
+        # Larger batches mean fewer API round-trips on full-namespace runs, at
+        # the cost of a longer wait before the first page is processed.
+        # The API caps this at 50 for accounts without the apihighlimits right.
+        generator = pagegenerators.PreloadingGenerator(generator, groupsize=250)
         bot = CharacterLinkFixBot(generator=generator, valid_names=valid_names, **options)
         bot.run()
     else:
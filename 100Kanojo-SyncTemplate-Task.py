@@ -19,6 +19,8 @@ MAPPING_PAGE_TITLE = "MediaWiki:SyncTemplateMapping"
 FAMILY_NAME = "mottrambangai" # Ensure this family is defined in your user-config.py
 SOURCE_LANG = "en"
 TARGET_LANG = "vi"
+# Namespace prefixes users may accidentally include in the mapping list
+TEMPLATE_PREFIXES = ("Template:", "Bản mẫu:")
 
 class TemplateSyncBot(bot.BaseBot):
     """
@@ -67,15 +69,18 @@ class TemplateSyncBot(bot.BaseBot):
             source_content = source_page.text
             
             # 3. Check if target exists and compare content
+            # Read the target text once and reuse it for the comparison and userPut
+            target_text = ''
             if target_page.exists():
-                if target_page.text == source_content:
+                target_text = target_page.text
+                if target_text == source_content:
                     pywikibot.info(f"No changes needed for {target_page.title()}")
                     return
             
             # 4. Save changes using userPut (handles diff display and confirmation)
             self.userPut(
                 target_page,
-                target_page.text,
+                target_text,
                 source_content,
                 summary=self.opt.summary,
                 ignore_save_related_errors=True
@@ -84,6 +89,15 @@ class TemplateSyncBot(bot.BaseBot):
         except pywikibot.exceptions.Error as e:
             pywikibot.error(f"Error processing {target_page.title()}: {e}")
 
+def strip_template_prefix(name):
+    """
+    Removes a leading template namespace prefix from a template name.
+    """
+    for prefix in TEMPLATE_PREFIXES:
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    return name
+
 def load_mappings(site, mapping_page_title):
     """
     Parses the mapping page and yields tuples of (en_title, vi_title).
@@ -107,16 +121,21 @@ def load_mappings(site, mapping_page_title):
     count = 0
     
     for line in lines:
-        if "|" in line:
-            parts = line.split("|")
-            # Strip namespaces if user accidentally included them in the mapping list
-            # We enforce namespace 10 in the bot class, so we just need the base name here.
-            src_raw = parts[0].strip().replace("Template:", "").replace("Bản mẫu:", "")
-            tgt_raw = parts[1].strip().replace("Template:", "").replace("Bản mẫu:", "")
-
-            if src_raw and tgt_raw:
-                count += 1
-                yield (src_raw, tgt_raw)
+        left, sep, right = line.partition("|")
+        if not sep:
+            continue
+
+        # Only the first two columns are used; ignore anything after a second pipe
+        right = right.partition("|")[0]
+
+        # Strip namespaces if user accidentally included them in the mapping list
+        # We enforce namespace 10 in the bot class, so we just need the base name here.
+        src_raw = strip_template_prefix(left.strip())
+        tgt_raw = strip_template_prefix(right.strip())
+
+        if src_raw and tgt_raw:
+            count += 1
+            yield (src_raw, tgt_raw)
     
     pywikibot.info(f"Loaded {count} mappings.")
 
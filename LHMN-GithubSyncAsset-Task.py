@@ -8,19 +8,26 @@ Mapping rules:
 - Module/filename.lua -> Module:filename
 """
 
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 import requests
 
 import pywikibot
-from pywikibot import exceptions
+from pywikibot import exceptions, pagegenerators
 
 
 # Broken down to respect the 80-character line limit
 GITHUB_API_BASE = 'https://api.github.com/repos/wikilophocmatngu'
 GITHUB_API_URL = f'{GITHUB_API_BASE}/assets/contents/'
 LOCAL_SYNC_DIR = './local_wiki_sync'
+# Last seen ETag and content of each GitHub file, for conditional requests
+ETAG_CACHE_PATH = os.path.join(LOCAL_SYNC_DIR, '.etag.json')
 SYNC_DIRS = ['MediaWiki', 'Module']
+# Stays below the default requests connection pool size (10)
+MAX_DOWNLOAD_WORKERS = 8
 
 
 def convert_path_to_title(file_path: str) -> str:
@@ -73,10 +80,13 @@ def convert_title_to_path(page_title: str) -> str:
     return ''
 
 
-def fetch_github_directory_contents(directory_path: str) -> list:
+def fetch_github_directory_contents(session: requests.Session,
+                                    directory_path: str) -> list:
     """
     Fetch the list of files in a specific directory using the GitHub API.
 
+    :param session: The HTTP session used for GitHub requests
+    :type session: requests.Session
     :param directory_path: The path of the directory to fetch
     :type directory_path: str
     :return: A list of dictionaries containing file metadata
@@ -84,7 +94,7 @@ def fetch_github_directory_contents(directory_path: str) -> list:
     """
     try:
         url = f'{GITHUB_API_URL}{directory_path}'
-        response = requests.get(url, timeout=10)
+        response = session.get(url, timeout=10)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as error:
@@ -92,53 +102,170 @@ def fetch_github_directory_contents(directory_path: str) -> list:
         return []
 
 
+def load_etag_cache() -> dict:
+    """
+    Load the cached GitHub ETags and file contents from the sync directory.
+
+    Malformed entries are dropped so they are refetched in full.
+
+    :return: A mapping of repository file paths to cache entries
+    :rtype: dict
+    """
+    try:
+        with open(ETAG_CACHE_PATH, encoding='utf-8') as file:
+            cache = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as error:
+        pywikibot.warning(f'Ignoring unreadable ETag cache: {error}')
+        return {}
+
+    if not isinstance(cache, dict):
+        pywikibot.warning('Ignoring malformed ETag cache.')
+        return {}
+
+    return {
+        path: entry for path, entry in cache.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get('etag'), str)
+        and isinstance(entry.get('content'), str)
+    }
+
+
+def save_etag_cache(cache: dict) -> None:
+    """
+    Save the GitHub ETags and file contents to the sync directory.
+
+    :param cache: A mapping of repository file paths to cache entries
+    :type cache: dict
+    """
+    try:
+        os.makedirs(LOCAL_SYNC_DIR, exist_ok=True)
+        with open(ETAG_CACHE_PATH, 'w', encoding='utf-8') as file:
+            json.dump(cache, file, ensure_ascii=False)
+    except OSError as error:
+        pywikibot.error(f'Failed to save ETag cache: {error}')
+
+
+def fetch_github_file_content(session: requests.Session,
+                              download_url: str,
+                              cached: Optional[dict] = None) -> dict:
+    """
+    Download the raw content of a single file from GitHub.
+
+    If a cache entry is given, the request is conditional on its ETag and
+    the cached entry is returned unchanged when GitHub answers 304.
+
+    :param session: The HTTP session used for GitHub requests
+    :type session: requests.Session
+    :param download_url: The raw download URL of the file
+    :type download_url: str
+    :param cached: The previous ``etag``/``content`` entry for the file
+    :type cached: dict or None
+    :return: A cache entry with the ``etag`` and ``content`` of the file
+    :rtype: dict
+    :raises requests.exceptions.RequestException: On network or HTTP errors
+    """
+    headers = {}
+    if cached:
+        headers['If-None-Match'] = cached['etag']
+
+    response = session.get(download_url, headers=headers, timeout=10)
+    if cached and response.status_code == requests.codes.not_modified:
+        return cached
+
+    response.raise_for_status()
+    return {'etag': response.headers.get('ETag'), 'content': response.text}
+
+
 def sync_github_to_wiki(site: pywikibot.Site) -> None:
     """
     Fetch text files from GitHub based on predefined directories.
 
+    File contents are downloaded concurrently over a shared session while
+    wiki edits are still made one at a time.
+
     :param site: The Pywikibot Site object representing the target wiki
     :type site: pywikibot.Site
     """
     pywikibot.output('--- Starting GitHub to Wiki Sync ---')
 
-    for directory in SYNC_DIRS:
-        files = fetch_github_directory_contents(directory)
+    etag_cache = load_etag_cache()
+    new_etag_cache = {}
 
-        for file_info in files:
-            if file_info.get('type') != 'file':
-                continue
+    with requests.Session() as session:
+        targets = []
+        for directory in SYNC_DIRS:
+            files = fetch_github_directory_contents(session, directory)
 
-            github_filepath = file_info.get('path')
-            download_url = file_info.get('download_url')
-            page_title = convert_path_to_title(github_filepath)
-
-            if not page_title or not download_url:
-                continue
-
-            try:
-                content_response = requests.get(download_url, timeout=10)
-                content_response.raise_for_status()
-                github_content = content_response.text
+            for file_info in files:
+                if file_info.get('type') != 'file':
+                    continue
 
-                page = pywikibot.Page(site, page_title)
+                github_filepath = file_info.get('path')
+                download_url = file_info.get('download_url')
+                page_title = convert_path_to_title(github_filepath)
 
-                if page.exists() and page.text == github_content:
-                    pywikibot.output(f'Skip {page_title}: No changes detected.')
+                if not page_title or not download_url:
                     continue
 
-                page.text = github_content
-                page.save(
-                    summary='Bot: Synchronizing code asset from GitHub',
-                    botflag=True
-                )
-                pywikibot.output(f'Updated {page_title} successfully.')
+                targets.append((github_filepath, download_url, page_title))
+
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            futures = [
+                executor.submit(fetch_github_file_content, session, url,
+                                etag_cache.get(path))
+                for path, url, _ in targets
+            ]
 
-            except requests.exceptions.RequestException as error:
-                pywikibot.error(f'Network error on {github_filepath}: {error}')
-            except exceptions.LockedPageError:
-                pywikibot.error(f'Cannot edit {page_title}: Page is locked.')
-            except exceptions.PywikibotException as error:
-                pywikibot.error(f'Pywikibot error on {page_title}: {error}')
+            # Load current wiki content for all targets in batched API
+            # requests while the downloads are running. Pages that could not
+            # be preloaded are loaded one by one in the loop below.
+            pages = {title: pywikibot.Page(site, title)
+                     for _, _, title in targets}
+            try:
+                list(pagegenerators.PreloadingGenerator(pages.values(),
+                                                        groupsize=50))
+            except (exceptions.PywikibotException,
+                    requests.exceptions.RequestException) as error:
+                pywikibot.warning(f'Failed to preload wiki pages: {error}')
+
+            for (github_filepath, _, page_title), future in zip(targets,
+                                                                futures):
+                try:
+                    entry = future.result()
+                    if entry['etag']:
+                        new_etag_cache[github_filepath] = entry
+                    github_content = entry['content']
+
+                    page = pages[page_title]
+                    # exists() is answered from the preloaded data; it also
+                    # avoids a text request for pages that are missing.
+                    current_content = page.text if page.exists() else None
+
+                    if current_content == github_content:
+                        pywikibot.output(
+                            f'Skip {page_title}: No changes detected.')
+                        continue
+
+                    page.text = github_content
+                    page.save(
+                        summary='Bot: Synchronizing code asset from GitHub',
+                        botflag=True
+                    )
+                    pywikibot.output(f'Updated {page_title} successfully.')
+
+                except requests.exceptions.RequestException as error:
+                    pywikibot.error(
+                        f'Network error on {github_filepath}: {error}')
+                except exceptions.LockedPageError:
+                    pywikibot.error(
+                        f'Cannot edit {page_title}: Page is locked.')
+                except exceptions.PywikibotException as error:
+                    pywikibot.error(
+                        f'Pywikibot error on {page_title}: {error}')
+
+    save_etag_cache(new_etag_cache)
 
 
 def sync_wiki_to_local(site: pywikibot.Site) -> None:
@@ -154,8 +281,8 @@ def sync_wiki_to_local(site: pywikibot.Site) -> None:
 
     for ns in namespaces_to_sync:
         for page in site.allpages(namespace=ns):
+            page_title = page.title()
             try:
-                page_title = page.title()
                 local_filepath = convert_title_to_path(page_title)
 
                 if not local_filepath:
@@ -164,15 +291,17 @@ def sync_wiki_to_local(site: pywikibot.Site) -> None:
                 full_path = os.path.join(LOCAL_SYNC_DIR, local_filepath)
                 os.makedirs(os.path.dirname(full_path), exist_ok=True)
 
-                with open(full_path, 'w', encoding='utf-8') as file:
-                    file.write(page.text)
+                # Encode once and write bytes directly, bypassing the
+                # text layer and its newline translation.
+                with open(full_path, 'wb') as file:
+                    file.write(page.text.encode('utf-8'))
 
                 pywikibot.output(f'Saved {page_title} to {full_path}.')
 
             except OSError as error:
                 pywikibot.error(f'File error saving {local_filepath}: {error}')
             except Exception as error:
-                pywikibot.error(f'Error processing {page.title()}: {error}')
+                pywikibot.error(f'Error processing {page_title}: {error}')
 
 
 def main(*args: str) -> None: